@@ -3,8 +3,8 @@
 Setup script to create .env file from .env.example
 """
 import os
-import shutil
 import secrets
+from pathlib import Path
 
 def setup_environment():
     """Create .env file with secure defaults"""
@@ -16,22 +16,15 @@ def setup_environment():
             print('Setup cancelled.')
             return
     
-    # Copy .env.example to .env
-    shutil.copy('.env.example', '.env')
-    
     # Generate secure keys
     api_key = secrets.token_urlsafe(32)
     secret_key = secrets.token_urlsafe(64)
     
-    # Read and update .env
-    with open('.env', 'r') as f:
-        content = f.read()
-    
+    # Fill in the template and write .env in one go
+    content = Path('.env.example').read_text()
     content = content.replace('your-secret-api-key-here', api_key)
     content = content.replace('your-jwt-secret-key-here-make-it-long-and-random', secret_key)
-    
-    with open('.env', 'w') as f:
-        f.write(content)
+    Path('.env').write_text(content)
     
     print('✅ Created .env file with secure keys')
     print('⚠️  Remember to update your Xero credentials in .env')
@@ -0,0 +1,25 @@
+"""
+API key authentication for the Xero Integration API
+"""
+import logging
+import secrets
+
+from fastapi import HTTPException, Header
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# Encode the configured key once so each request only encodes the header value
+_API_KEY_BYTES = settings.api_key.encode()
+
+# Dependency for API key validation
+async def verify_api_key(x_api_key: str = Header(...)):
+    """Validate API key from header using a constant-time comparison"""
+    if not x_api_key or not secrets.compare_digest(x_api_key.encode(), _API_KEY_BYTES):
+        logger.warning("Invalid API key attempt")
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid API Key"
+        )
+    return True
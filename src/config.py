@@ -1,47 +1,51 @@
 """
 Configuration management for the Xero API
 """
-import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-from pydantic_settings import BaseSettings
-from dotenv import load_dotenv
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
-# Load environment variables
 env_path = Path(__file__).parent.parent / '.env'
-load_dotenv(env_path)
 
 class Settings(BaseSettings):
-    """Application settings"""
+    """Application settings, read from the environment and .env once"""
     
     # API Settings
-    api_key: str = os.getenv("API_KEY", "")
-    api_version: str = os.getenv("API_VERSION", "v1")
-    environment: str = os.getenv("ENVIRONMENT", "development")
+    api_key: str = ""
+    api_version: str = "v1"
+    environment: str = "development"
     
     # Xero Settings
-    xero_client_id: str = os.getenv("XERO_CLIENT_ID", "")
-    xero_client_secret: str = os.getenv("XERO_CLIENT_SECRET", "")
-    xero_redirect_uri: str = os.getenv("XERO_REDIRECT_URI", "http://localhost:8000/callback")
+    xero_client_id: str = ""
+    xero_client_secret: str = ""
+    xero_redirect_uri: str = "http://localhost:8000/callback"
     
     # Security
-    secret_key: str = os.getenv("SECRET_KEY", "")
-    algorithm: str = os.getenv("ALGORITHM", "HS256")
-    access_token_expire_minutes: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+    secret_key: str = ""
+    algorithm: str = "HS256"
+    access_token_expire_minutes: int = 30
     
     # Database
-    database_url: str = os.getenv("DATABASE_URL", "sqlite:///./xero_tokens.db")
+    database_url: str = "sqlite:///./xero_tokens.db"
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    # Field names match the upper-case env vars case-insensitively
+    model_config = SettingsConfigDict(
+        env_file=env_path,
+        extra="ignore",
+        frozen=True,
+    )
+
+@lru_cache()
+def get_settings():
+    """Build the settings once per process"""
+    return Settings()
 
 # Create settings instance
-settings = Settings()
+settings = get_settings()
 
 # Validate critical settings
-def validate_settings():
-    """Validate that all required settings are present"""
+def get_settings_errors():
+    """Return a list of missing required settings"""
     errors = []
     
     if not settings.api_key:
@@ -53,11 +57,9 @@ def validate_settings():
     if not settings.xero_client_secret:
         errors.append("XERO_CLIENT_SECRET is not set")
     
-    if errors:
-        print("❌ Configuration errors:")
-        for error in errors:
-            print(f"  - {error}")
-        print("\n📝 Please update your .env file")
-        return False
-    
-    return True
\ No newline at end of file
+    return errors
+
+@lru_cache(maxsize=1)
+def validate_settings():
+    """Validate that all required settings are present (cached, settings are fixed at startup)"""
+    return not get_settings_errors()
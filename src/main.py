@@ -1,12 +1,17 @@
 """
 Main FastAPI application for Xero Integration
 """
-from fastapi import FastAPI, HTTPException, Depends, Header
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from typing import Optional
 import logging
+import os
 
-from .config import settings, validate_settings
+from .config import settings, validate_settings, get_settings_errors
+from .auth import verify_api_key
 
 # Set up logging
 logging.basicConfig(
@@ -15,6 +20,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Application lifespan
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Validate configuration once on startup and log shutdown"""
+    logger.info(f"Starting Xero Integration API {settings.api_version}")
+    logger.info(f"Environment: {settings.environment}")
+    
+    # Validate configuration
+    if not validate_settings():
+        for error in get_settings_errors():
+            logger.error(f"Configuration error: {error}")
+        logger.error("Invalid configuration. Please check your .env file")
+    else:
+        logger.info("Configuration validated successfully")
+    
+    yield
+    
+    logger.info("Shutting down Xero Integration API")
+
 # Create FastAPI app
 app = FastAPI(
     title="Xero Integration API",
@@ -22,6 +46,8 @@ app = FastAPI(
     version=settings.api_version,
     docs_url="/docs" if settings.environment == "development" else None,
     redoc_url="/redoc" if settings.environment == "development" else None,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -33,17 +59,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Dependency for API key validation
-async def verify_api_key(x_api_key: str = Header(...)):
-    """Validate API key from header"""
-    if x_api_key != settings.api_key:
-        logger.warning(f"Invalid API key attempt: {x_api_key[:8]}...")
-        raise HTTPException(
-            status_code=401,
-            detail="Invalid API Key"
-        )
-    return True
-
 # Root endpoint
 @app.get("/")
 async def root():
@@ -60,7 +75,7 @@ async def root():
 async def health_check():
     """Health check endpoint"""
     
-    # Check configuration
+    # Check configuration (cached after the first call)
     config_valid = validate_settings()
     
     return {
@@ -79,21 +94,13 @@ async def test_endpoint(authorized: bool = Depends(verify_api_key)):
         "authorized": authorized
     }
 
-# Startup event
-@app.on_event("startup")
-async def startup_event():
-    """Run on application startup"""
-    logger.info(f"Starting Xero Integration API {settings.api_version}")
-    logger.info(f"Environment: {settings.environment}")
-    
-    # Validate configuration
-    if not validate_settings():
-        logger.error("Invalid configuration. Please check your .env file")
-    else:
-        logger.info("Configuration validated successfully")
+if __name__ == "__main__":
+    import uvicorn
 
-# Shutdown event
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Run on application shutdown"""
-    logger.info("Shutting down Xero Integration API")
\ No newline at end of file
+    # uvicorn picks uvloop/httptools automatically when they are installed
+    uvicorn.run(
+        "src.main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=1 if settings.environment == "development" else os.cpu_count(),
+    )
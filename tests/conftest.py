@@ -0,0 +1,9 @@
+"""
+Shared test configuration
+"""
+import os
+
+# Settings are read once at import, so set them before the app is imported
+os.environ["API_KEY"] = "test-api-key"
+os.environ["XERO_CLIENT_ID"] = "test-client-id"
+os.environ["XERO_CLIENT_SECRET"] = "test-client-secret"
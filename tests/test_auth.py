@@ -0,0 +1,42 @@
+"""
+Tests for API key authentication
+"""
+from fastapi.testclient import TestClient
+
+from src import auth
+from src.main import app
+
+client = TestClient(app)
+
+
+def test_valid_api_key():
+    response = client.get("/api/test", headers={"X-API-Key": "test-api-key"})
+    assert response.status_code == 200
+    assert response.json()["authorized"] is True
+
+
+def test_wrong_api_key():
+    response = client.get("/api/test", headers={"X-API-Key": "test-api-kez"})
+    assert response.status_code == 401
+
+
+def test_empty_api_key():
+    response = client.get("/api/test", headers={"X-API-Key": ""})
+    assert response.status_code == 401
+
+
+def test_empty_api_key_with_unset_setting(monkeypatch):
+    monkeypatch.setattr(auth, "_API_KEY_BYTES", b"")
+    response = client.get("/api/test", headers={"X-API-Key": ""})
+    assert response.status_code == 401
+
+
+def test_missing_api_key_header():
+    response = client.get("/api/test")
+    assert response.status_code == 422
+
+
+def test_rejected_key_is_not_logged(caplog):
+    client.get("/api/test", headers={"X-API-Key": "test-api-kez"})
+    assert "Invalid API key attempt" in caplog.text
+    assert "test-api" not in caplog.text
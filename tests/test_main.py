@@ -0,0 +1,21 @@
+"""
+Tests for the main application endpoints
+"""
+from fastapi.testclient import TestClient
+
+from src.main import app
+
+
+def test_health_without_lifespan():
+    client = TestClient(app)
+    response = client.get("/health")
+    assert response.status_code == 200
+    assert response.json()["status"] == "healthy"
+    assert response.json()["configuration"] == "valid"
+
+
+def test_health_with_lifespan():
+    with TestClient(app) as client:
+        response = client.get("/health")
+    assert response.status_code == 200
+    assert response.json()["status"] == "healthy"